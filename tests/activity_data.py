@@ -0,0 +1,81 @@
+"""
+Initial activity data and URLs shared by the Mergington High School API tests
+"""
+
+from urllib.parse import quote
+
+
+# Initial activity state, loaded into `activities` at session start and after mutating tests
+ORIGINAL_ACTIVITIES = {
+    "Debate Team": {
+        "description": "Develop public speaking and argumentation skills",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["alex@mergington.edu"]
+    },
+    "Math Olympiad": {
+        "description": "Compete in mathematical problem-solving competitions",
+        "schedule": "Saturdays, 10:00 AM - 12:00 PM",
+        "max_participants": 20,
+        "participants": ["james@mergington.edu", "maya@mergington.edu"]
+    },
+    "Basketball Team": {
+        "description": "Join the varsity basketball team and compete in league games",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": ["tyler@mergington.edu"]
+    },
+    "Soccer Club": {
+        "description": "Play recreational and competitive soccer",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 22,
+        "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Perform in theatrical productions and develop acting skills",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ["emma@mergington.edu", "jack@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Explore painting, drawing, and sculpture techniques",
+        "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
+        "max_participants": 18,
+        "participants": ["grace@mergington.edu"]
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
+# Fields the reset in conftest.py copies by name; checked once here so a new
+# field cannot be silently dropped from the reset
+ACTIVITY_FIELDS = {"description", "schedule", "max_participants", "participants"}
+assert all(details.keys() == ACTIVITY_FIELDS for details in ORIGINAL_ACTIVITIES.values())
+
+
+# Initial participants per activity, for O(1) membership checks in assertions
+ORIGINAL_PARTICIPANTS = {
+    name: frozenset(details["participants"])
+    for name, details in ORIGINAL_ACTIVITIES.items()
+}
+
+
+# Percent-encoded base URL for each activity, e.g. "/activities/Debate%20Team"
+URLS = {name: f"/activities/{quote(name)}" for name in ORIGINAL_ACTIVITIES}
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app import app, activities
+from tests.activity_data import ORIGINAL_ACTIVITIES
+
+
+def _clone_template(template):
+    """Copy an activities template without going through copy.deepcopy"""
+    # Strings and ints are immutable and can be shared; only participants is cloned
+    return {
+        name: {
+            "description": details["description"],
+            "schedule": details["schedule"],
+            "max_participants": details["max_participants"],
+            "participants": details["participants"].copy(),
+        }
+        for name, details in template.items()
+    }
+
+
+def _reset_activities():
+    """Replace the app's activities with a fresh copy of the template"""
+    activities.clear()
+    activities.update(_clone_template(ORIGINAL_ACTIVITIES))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create an async test client for the FastAPI app, shared across the session"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _warm(client):
+    """Build the OpenAPI schema and serve one request before the first test runs"""
+    app.openapi()
+    await client.get("/activities")
+
+
+def pytest_sessionstart(session):
+    """Load the test template so every worker starts from the same state"""
+    # The app's own activities literal may drift from ORIGINAL_ACTIVITIES
+    _reset_activities()
+
+
+def pytest_runtest_teardown(item):
+    """Restore activities to initial state after tests marked mutates_activities"""
+    # Read-only tests leave the state untouched, so only mutating ones pay for the reset
+    if item.get_closest_marker("mutates_activities") is not None:
+        _reset_activities()
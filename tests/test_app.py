@@ -2,291 +2,195 @@
 Test suite for the Mergington High School Activities API
 """
 
-import sys
-from pathlib import Path
+import asyncio
+from urllib.parse import quote
 import pytest
-from fastapi.testclient import TestClient
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities
+from tests.activity_data import ORIGINAL_ACTIVITIES, ORIGINAL_PARTICIPANTS, URLS
 
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Debate Team": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Compete in mathematical problem-solving competitions",
-            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
-            "max_participants": 20,
-            "participants": ["james@mergington.edu", "maya@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Join the varsity basketball team and compete in league games",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["tyler@mergington.edu"]
-        },
-        "Soccer Club": {
-            "description": "Play recreational and competitive soccer",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in theatrical productions and develop acting skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["emma@mergington.edu", "jack@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 18,
-            "participants": ["grace@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Clear current activities
-    activities.clear()
-    # Restore original activities
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+# Run every test on the session event loop so they can share the client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
-        """Test that GET /activities returns all available activities"""
-        response = client.get("/activities")
+    async def test_get_activities(self, client):
+        """Test that GET /activities returns every activity with its details"""
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
+        
+        # All activities are returned
         assert len(data) == 9
-        assert "Debate Team" in data
-        assert "Math Olympiad" in data
-        assert "Chess Club" in data
-    
-    def test_get_activities_contains_correct_fields(self, client):
-        """Test that activities have all required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Debate Team"]
+        assert {"Debate Team", "Math Olympiad", "Chess Club"} <= data.keys()
         
-        assert "description" in activity
-        assert "schedule" in activity
-        assert "max_participants" in activity
-        assert "participants" in activity
-    
-    def test_get_activities_contains_initial_participants(self, client):
-        """Test that activities show initial participants"""
-        response = client.get("/activities")
-        data = response.json()
+        # Each activity has the required fields
+        activity = data["Debate Team"]
+        assert {"description", "schedule", "max_participants", "participants"} <= activity.keys()
         
-        assert "alex@mergington.edu" in data["Debate Team"]["participants"]
-        assert "james@mergington.edu" in data["Math Olympiad"]["participants"]
+        # Initial participants are listed
+        for name, details in ORIGINAL_ACTIVITIES.items():
+            assert data[name]["participants"] == details["participants"]
 
 
-class TestSignupForActivity:
-    """Tests for POST /activities/{activity_name}/signup endpoint"""
-    
-    def test_signup_successful(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Debate%20Team/signup?email=newstudent@mergington.edu"
+@pytest.mark.mutates_activities
+class TestParticipantEndpoints:
+    """Tests shared by the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("verb,path_suffix,ok_msg,email", [
+        ("post", "signup", "Signed up", "newstudent@mergington.edu"),
+        ("delete", "unregister", "Unregistered", "alex@mergington.edu"),
+    ], ids=["signup", "unregister"])
+    async def test_successful(self, client, verb, path_suffix, ok_msg, email):
+        """Test a successful signup or unregistration"""
+        response = await getattr(client, verb)(
+            f"{URLS['Debate Team']}/{path_suffix}?email={email}"
         )
         assert response.status_code == 200
         data = response.json()
-        assert "Signed up" in data["message"]
-        assert "newstudent@mergington.edu" in data["message"]
-    
-    def test_signup_adds_participant(self, client):
-        """Test that signup actually adds the participant to the activity"""
-        response = client.post(
-            "/activities/Debate%20Team/signup?email=newstudent@mergington.edu"
+        assert ok_msg in data["message"]
+        assert email in data["message"]
+    
+    @pytest.mark.parametrize("verb,path_suffix,email,registered", [
+        ("post", "signup", "newstudent@mergington.edu", True),
+        ("delete", "unregister", "alex@mergington.edu", False),
+    ], ids=["signup", "unregister"])
+    async def test_updates_participants(self, client, verb, path_suffix, email, registered):
+        """Test that the participant list reflects the signup or unregistration"""
+        response = await getattr(client, verb)(
+            f"{URLS['Debate Team']}/{path_suffix}?email={email}"
         )
         assert response.status_code == 200
         
-        # Verify participant was added
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert "newstudent@mergington.edu" in data["Debate Team"]["participants"]
-    
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for a non-existent activity"""
-        response = client.post(
-            "/activities/NonExistent%20Club/signup?email=student@mergington.edu"
+        # Verify participant was added or removed and nobody else was affected
+        original = ORIGINAL_ACTIVITIES["Debate Team"]["participants"]
+        if registered:
+            expected = original + [email]
+        else:
+            expected = [p for p in original if p != email]
+        assert activities["Debate Team"]["participants"] == expected
+
+
+class TestNonexistentActivity:
+    """Tests for signup and unregister against an unknown activity"""
+    
+    @pytest.mark.parametrize("method", ["post", "delete"])
+    async def test_nonexistent_activity(self, client, method):
+        """Test that both endpoints reject a non-existent activity without touching state"""
+        path_suffix = "signup" if method == "post" else "unregister"
+        response = await getattr(client, method)(
+            f"/activities/{quote('NonExistent Club')}/{path_suffix}?email=student@mergington.edu"
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
+        assert activities == ORIGINAL_ACTIVITIES
+
+
+class TestSignupForActivity:
+    """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_duplicate_participant(self, client):
+    async def test_signup_duplicate_participant(self, client):
         """Test that a student cannot signup twice for the same activity"""
         # Try to signup with an email already registered
-        response = client.post(
-            "/activities/Debate%20Team/signup?email=alex@mergington.edu"
+        assert "alex@mergington.edu" in activities["Debate Team"]["participants"]
+        response = await client.post(
+            f"{URLS['Debate Team']}/signup?email=alex@mergington.edu"
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
     
-    def test_signup_multiple_students(self, client):
+    @pytest.mark.mutates_activities
+    async def test_signup_multiple_students(self, client):
         """Test that multiple different students can sign up"""
-        response1 = client.post(
-            "/activities/Debate%20Team/signup?email=student1@mergington.edu"
-        )
-        response2 = client.post(
-            "/activities/Debate%20Team/signup?email=student2@mergington.edu"
+        response1, response2 = await asyncio.gather(
+            client.post(f"{URLS['Debate Team']}/signup?email=student1@mergington.edu"),
+            client.post(f"{URLS['Debate Team']}/signup?email=student2@mergington.edu"),
         )
         
         assert response1.status_code == 200
         assert response2.status_code == 200
         
         # Verify both were added
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert "student1@mergington.edu" in data["Debate Team"]["participants"]
-        assert "student2@mergington.edu" in data["Debate Team"]["participants"]
+        assert "student1@mergington.edu" in activities["Debate Team"]["participants"]
+        assert "student2@mergington.edu" in activities["Debate Team"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_successful(self, client):
-        """Test successful unregistration from an activity"""
-        response = client.delete(
-            "/activities/Debate%20Team/unregister?email=alex@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "Unregistered" in data["message"]
-        assert "alex@mergington.edu" in data["message"]
-    
-    def test_unregister_removes_participant(self, client):
-        """Test that unregister actually removes the participant"""
-        response = client.delete(
-            "/activities/Debate%20Team/unregister?email=alex@mergington.edu"
-        )
-        assert response.status_code == 200
-        
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert "alex@mergington.edu" not in data["Debate Team"]["participants"]
-    
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregister from a non-existent activity"""
-        response = client.delete(
-            "/activities/NonExistent%20Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-    
-    def test_unregister_not_registered_participant(self, client):
+    async def test_unregister_not_registered_participant(self, client):
         """Test unregister for a student not registered in the activity"""
-        response = client.delete(
-            "/activities/Debate%20Team/unregister?email=notregistered@mergington.edu"
+        assert "notregistered@mergington.edu" not in activities["Debate Team"]["participants"]
+        response = await client.delete(
+            f"{URLS['Debate Team']}/unregister?email=notregistered@mergington.edu"
         )
         assert response.status_code == 400
         assert "not registered" in response.json()["detail"]
     
-    def test_unregister_multiple_participants(self, client):
+    @pytest.mark.mutates_activities
+    async def test_unregister_multiple_participants(self, client):
         """Test unregistering multiple participants from an activity"""
         # Math Olympiad has 2 participants
-        response1 = client.delete(
-            "/activities/Math%20Olympiad/unregister?email=james@mergington.edu"
-        )
-        response2 = client.delete(
-            "/activities/Math%20Olympiad/unregister?email=maya@mergington.edu"
+        response1, response2 = await asyncio.gather(
+            client.delete(f"{URLS['Math Olympiad']}/unregister?email=james@mergington.edu"),
+            client.delete(f"{URLS['Math Olympiad']}/unregister?email=maya@mergington.edu"),
         )
         
         assert response1.status_code == 200
         assert response2.status_code == 200
         
         # Verify both were removed
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert len(data["Math Olympiad"]["participants"]) == 0
+        assert len(activities["Math Olympiad"]["participants"]) == 0
 
 
+@pytest.mark.mutates_activities
 class TestIntegration:
     """Integration tests combining signup and unregister"""
     
-    def test_signup_then_unregister(self, client):
-        """Test signing up and then unregistering"""
+    async def test_signup_then_unregister(self, client):
+        """Test signing up and then unregistering, as seen through GET /activities"""
         email = "testuser@mergington.edu"
         activity = "Debate Team"
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
+        signup_response = await client.post(
+            f"{URLS[activity]}/signup?email={email}"
         )
         assert signup_response.status_code == 200
         
         # Verify signed up
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         assert email in activities_response.json()[activity]["participants"]
         
         # Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}"
+        unregister_response = await client.delete(
+            f"{URLS[activity]}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
         
         # Verify unregistered
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         assert email not in activities_response.json()[activity]["participants"]
     
-    def test_concurrent_signups_and_activity_state(self, client):
+    async def test_concurrent_signups_and_activity_state(self, client):
         """Test that activity state is correctly maintained with multiple operations"""
         activity = "Soccer Club"
         initial_count = len(activities[activity]["participants"])
         
-        # Sign up 3 new students
-        for i in range(3):
-            response = client.post(
-                f"/activities/{activity.replace(' ', '%20')}/signup?email=student{i}@mergington.edu"
-            )
+        emails = [f"student{i}@mergington.edu" for i in range(3)]
+        
+        # Sign up 3 new students concurrently
+        responses = await asyncio.gather(*[
+            client.post(f"{URLS[activity]}/signup?email={email}") for email in emails
+        ])
+        for email, response in zip(emails, responses):
             assert response.status_code == 200
+            assert email in response.json()["message"]
         
-        # Check final count
-        activities_response = client.get("/activities")
-        final_count = len(activities_response.json()[activity]["participants"])
-        assert final_count == initial_count + 3
+        # Check final count and that exactly the new students were added
+        participants = activities[activity]["participants"]
+        assert len(participants) == initial_count + 3
+        added = [p for p in participants if p not in ORIGINAL_PARTICIPANTS[activity]]
+        assert sorted(added) == emails